@@ -0,0 +1,69 @@
+"""Startup latency of the application for several field sizes.
+
+Runs 'task/main.py' as a scripted invocation and measures the wall
+time of a session that exits at once (time to the first prompt) and
+of a session with one command that needs the field.
+
+Usage:
+    python benchmarks/startup_latency.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import List
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_PATH = os.path.join(PROJECT_DIRECTORY, "task", "main.py")
+
+
+def run_session(size: int, commands: List[str]) -> float:
+    """Runs the application with a square field and given commands.
+
+    Args:
+        size: the number of rows and columns in a generated field.
+        commands: commands to send to the application.
+
+    Returns:
+        the wall time of the session in seconds.
+    """
+    environment = dict(os.environ, PYTHONPATH=PROJECT_DIRECTORY)
+    arguments = [
+        sys.executable,
+        MAIN_PATH,
+        f"--n_rows={size}",
+        f"--n_cols={size}",
+        "--p=0.2",
+        "--radius=2",
+        f"--logfile={os.devnull}",
+    ]
+
+    start = time.perf_counter()
+    subprocess.run(  # noqa: S603
+        arguments,
+        input="\n".join(commands + ["exit"]) + "\n",
+        stdout=subprocess.DEVNULL,
+        env=environment,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def main(sizes: List[int], repeats: int = 3):
+    """Prints the best of 'repeats' session times for each size.
+
+    Args:
+        sizes: sizes of square fields.
+        repeats: the number of runs for each measurement.
+    """
+    print(f"{'size':>6} {'exit (ms)':>10} {'left + exit (ms)':>17}")
+    for size in sizes:
+        exit_time = min(run_session(size, []) for _ in range(repeats))
+        command_time = min(run_session(size, ["left"]) for _ in range(repeats))
+        print(f"{size:>6} {exit_time * 1000:>10.1f} {command_time * 1000:>17.1f}")
+
+
+if __name__ == "__main__":
+    main([10, 100, 1000, 3000])
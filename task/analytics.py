@@ -0,0 +1,274 @@
+import json
+import os
+from typing import Dict, Tuple
+
+import numpy as np
+
+from task.field import Field
+from task.journal import Journal
+
+
+class Trajectory:
+    """
+    Robot movement history stored as numpy arrays.
+
+    Each row of the arrays describes one step of the history in the
+    same order the robot made them. Directions are stored as codes
+    from 'direction_codes' (the same as in the undo journal),
+    so the difference of two codes modulo 4 tells which turn was made.
+
+    A trajectory can be built from a robot's 'movement_history' via
+    'from_history' classmethod or read from a json file written by
+    'save_path' via 'from_file' classmethod.
+
+    Args:
+        previous_positions: (n, 2) array with positions
+                            before each step.
+        previous_directions: (n,) array with direction codes
+                             before each step.
+        current_positions: (n, 2) array with positions after each step.
+        current_directions: (n,) array with direction codes
+                            after each step.
+
+    Attributes:
+        previous_positions, previous_directions, current_positions,
+        current_directions: same that in Args.
+        direction_codes: the dictionary that maps robot's direction
+                         and its code.
+        turn_names: the dictionary that maps the difference of direction
+                    codes and the name of the turn.
+    """
+
+    direction_codes = Journal.direction_codes
+    turn_names = {1: "turn_right", 2: "turn_back", 3: "turn_left"}
+
+    def __init__(
+        self,
+        previous_positions: np.ndarray,
+        previous_directions: np.ndarray,
+        current_positions: np.ndarray,
+        current_directions: np.ndarray,
+    ):
+        self.previous_positions = previous_positions
+        self.previous_directions = previous_directions
+        self.current_positions = current_positions
+        self.current_directions = current_directions
+
+    @classmethod
+    def from_history(cls, movement_history: dict) -> "Trajectory":
+        """Converts robot's 'movement_history' to a Trajectory object.
+
+        Args:
+            movement_history: dictionary that maps steps to step logs.
+                              Steps may be integers or strings (as in
+                              json files).
+
+        Returns:
+            A Trajectory object.
+        """
+        steps = sorted(movement_history, key=int)
+        step_logs = [movement_history[step] for step in steps]
+
+        def positions(key: str) -> np.ndarray:
+            return np.array(
+                [step_log[key] for step_log in step_logs], dtype=np.int64
+            ).reshape(-1, 2)
+
+        def directions(key: str) -> np.ndarray:
+            return np.array(
+                [cls.direction_codes[step_log[key]] for step_log in step_logs],
+                dtype=np.int8,
+            )
+
+        return cls(
+            positions("previous_position"),
+            directions("previous_direction"),
+            positions("current_position"),
+            directions("current_direction"),
+        )
+
+    @classmethod
+    def from_file(cls, path: str) -> "Trajectory":
+        """Reads a json file written by robot's 'save_path' method.
+
+        Args:
+            path: the path to the json file.
+
+        Returns:
+            A Trajectory object.
+        """
+        with open(path) as file:
+            return cls.from_history(json.load(file))
+
+    def __len__(self) -> int:
+        return len(self.current_positions)
+
+    @property
+    def moved(self) -> np.ndarray:
+        """Bool array with steps where the robot moved."""
+        return (self.previous_positions != self.current_positions).any(axis=1)
+
+    @property
+    def turned(self) -> np.ndarray:
+        """Bool array with steps where the robot turned."""
+        return self.previous_directions != self.current_directions
+
+    def get_visit_heatmap(self, shape: Tuple[int]) -> np.ndarray:
+        """Counts how many times the robot entered each cell.
+
+        The start position counts as the first visit. Steps where
+        the robot stayed in place (turns and blocked moves)
+        are not visits.
+
+        Args:
+            shape: shape of the field matrix (with walls).
+
+        Returns:
+            an array of 'shape' size with the number of visits.
+        """
+        heatmap = np.zeros(shape, dtype=np.int64)
+        if not len(self):
+            return heatmap
+
+        visited = np.concatenate(
+            (self.previous_positions[:1], self.current_positions[self.moved])
+        )
+        np.add.at(heatmap, (visited[:, 0], visited[:, 1]), 1)
+        return heatmap
+
+    def get_revisit_counts(self, shape: Tuple[int]) -> np.ndarray:
+        """Counts how many times the robot came back to each cell.
+
+        Args:
+            shape: shape of the field matrix (with walls).
+
+        Returns:
+            an array of 'shape' size with the number of revisits.
+        """
+        return np.maximum(self.get_visit_heatmap(shape) - 1, 0)
+
+    def get_blocked_move_rate(self) -> float:
+        """Finds the share of moves that were stopped by
+        a wall or a barier.
+
+        A move never changes the direction and a turn always does,
+        so a step without a turn and without a new position
+        is a blocked move.
+
+        Returns:
+            the share of blocked moves among all moves
+            (0 if there were no moves).
+        """
+        moves = ~self.turned
+        n_moves = np.count_nonzero(moves)
+        if not n_moves:
+            return 0.0
+        return np.count_nonzero(moves & ~self.moved) / n_moves
+
+    def get_turn_counts(self) -> Dict[str, int]:
+        """Counts the turns of each kind.
+
+        Returns:
+            the dictionary that maps turn command names to
+            the number of these turns.
+        """
+        turns = (self.current_directions - self.previous_directions) % 4
+        counts = np.bincount(turns[self.turned], minlength=4)
+        return {name: int(counts[code]) for code, name in self.turn_names.items()}
+
+    def get_net_displacement(self) -> np.ndarray:
+        """Finds the difference between the last and the start position.
+
+        Returns:
+            an array with row and column displacement.
+        """
+        if not len(self):
+            return np.zeros(2, dtype=np.int64)
+        return self.current_positions[-1] - self.previous_positions[0]
+
+    def get_path_efficiency(self, field: Field) -> float:
+        """Compares the shortest path between the start and the last
+        position with the number of cells the robot actually passed.
+
+        Args:
+            field: the field where the robot moved.
+
+        Returns:
+            shortest path length divided by the number of moves
+            (1 if the robot did not move).
+        """
+        n_moves = np.count_nonzero(self.moved)
+        if not n_moves:
+            return 1.0
+
+        start = tuple(self.previous_positions[0])
+        end = tuple(self.current_positions[-1])
+        return int(field.get_distances([start], target=end)[end]) / n_moves
+
+    def get_summary(self, field: Field) -> Dict[str, float]:
+        """Collects all scalar metrics of the trajectory.
+
+        Args:
+            field: the field where the robot moved.
+
+        Returns:
+            the dictionary that maps metric names and values.
+        """
+        net_dx, net_dy = self.get_net_displacement()
+        return {
+            "steps": len(self),
+            "revisits": int(self.get_revisit_counts(field.field.shape).sum()),
+            "blocked_move_rate": self.get_blocked_move_rate(),
+            **self.get_turn_counts(),
+            "net_dx": int(net_dx),
+            "net_dy": int(net_dy),
+            "path_efficiency": self.get_path_efficiency(field),
+        }
+
+    def save_arrays(self, directory: str, field: Field):
+        """Saves the trajectory arrays, the visit heatmap, revisit
+        counts and the summary to 'directory' as .npy files.
+
+        The summary is saved as a structured array with one record,
+        so metrics can be read by name without pickling.
+
+        Args:
+            directory: the directory to store files in. Will be
+                       created if it does not exist.
+            field: the field where the robot moved.
+        """
+        os.makedirs(directory, exist_ok=True)
+        summary = self.get_summary(field)
+        arrays = {
+            "previous_positions": self.previous_positions,
+            "previous_directions": self.previous_directions,
+            "current_positions": self.current_positions,
+            "current_directions": self.current_directions,
+            "visit_heatmap": self.get_visit_heatmap(field.field.shape),
+            "revisit_counts": self.get_revisit_counts(field.field.shape),
+            "summary": np.array(
+                [tuple(summary.values())],
+                dtype=[(name, np.float64) for name in summary],
+            ),
+        }
+        for name, array in arrays.items():
+            np.save(os.path.join(directory, f"{name}.npy"), array)
+
+
+def get_heatmap_view(field: Field, heatmap: np.ndarray) -> str:
+    """Represents the field as ascii symbols with visited cells
+    replaced by the number of visits ('*' for more than 9 visits).
+
+    Args:
+        field: the field where the robot moved.
+        heatmap: an array with the number of visits
+                 of the field shape.
+
+    Returns:
+        the field view as a string.
+    """
+    view = field.get_matrix_view(field.field)
+    for x, y in zip(*np.nonzero(heatmap)):
+        visits = heatmap[x, y]
+        view[x][y] = str(visits) if visits <= 9 else "*"
+    return "\n".join("".join(row) for row in view)
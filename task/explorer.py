@@ -0,0 +1,311 @@
+import contextlib
+import copy
+import os
+from typing import List, Tuple
+
+import numpy as np
+
+from task.field import Field, get_neighbours_mask, get_wavefront_distances
+from task.robot import Robot
+
+
+class KnownMap:
+    """
+    The part of a field that the robot has already seen.
+
+    The robot sees cells to which the Euclidean distance does not
+    exceed its light radius (the same as 'look' command shows).
+    The frontier (known free cells next to unknown cells) is updated
+    only around the point of view after each observation.
+
+    Args:
+        field: the field to explore.
+        light_radius: radius the robot can see.
+
+    Attributes:
+        free: bool array with empty cells of the field.
+        known: bool array with cells the robot has seen.
+        frontier: bool array with known free cells next
+                  to unknown cells.
+        n_known_free: the number of known free cells.
+        n_free: the number of free cells.
+        light_radius: same that 'light_radius' in Args (but not
+                      less than 1).
+        sight: bool array of (2 * radius + 1) size with cells
+               the robot can see from its center.
+    """
+
+    def __init__(self, field: Field, light_radius: int):
+        self.free = field.field == 0
+        self.known = np.zeros(self.free.shape, dtype=bool)
+        self.frontier = np.zeros(self.free.shape, dtype=bool)
+        self.n_known_free = 0
+
+        self.n_free = np.count_nonzero(self.free)
+
+        # Neighbours are always known: the robot can try to move there.
+        self.light_radius = max(light_radius, 1)
+        offsets = np.arange(-self.light_radius, self.light_radius + 1)
+        distances = np.sqrt(offsets[:, np.newaxis] ** 2 + offsets**2)
+        self.sight = distances <= self.light_radius
+
+    def copy(self) -> "KnownMap":
+        """Makes a copy with independent known cells and frontier.
+
+        Returns:
+            A KnownMap object.
+        """
+        known_map = copy.copy(self)
+        known_map.known = self.known.copy()
+        known_map.frontier = self.frontier.copy()
+        return known_map
+
+    @property
+    def coverage(self) -> float:
+        """The share of free cells the robot has seen."""
+        return self.n_known_free / self.n_free
+
+    def observe(self, x: int, y: int):
+        """Marks cells the robot can see from (x, y) as known
+        and updates the frontier around them.
+
+        Args:
+            x, y: coordinates of the robot.
+        """
+        radius = self.light_radius
+        top, left = max(x - radius, 0), max(y - radius, 0)
+        rows, cols = slice(top, x + radius + 1), slice(left, y + radius + 1)
+
+        known = self.known[rows, cols]
+        sight_top, sight_left = top - (x - radius), left - (y - radius)
+        sight_bottom = sight_top + known.shape[0]
+        sight_right = sight_left + known.shape[1]
+        sight = self.sight[sight_top:sight_bottom, sight_left:sight_right]
+
+        newly_known = sight & ~known
+        self.n_known_free += np.count_nonzero(newly_known & self.free[rows, cols])
+        known |= sight
+
+        self.update_frontier(top - 1, x + radius + 2, left - 1, y + radius + 2)
+
+    def update_frontier(self, top: int, bottom: int, left: int, right: int):
+        """Recomputes the frontier in the [top, bottom) x [left, right)
+        rectangle (cut to the field size).
+
+        Args:
+            top, bottom: rows of the rectangle.
+            left, right: columns of the rectangle.
+        """
+        n_rows, n_cols = self.known.shape
+        top, left = max(top, 0), max(left, 0)
+        bottom, right = min(bottom, n_rows), min(right, n_cols)
+
+        # One more cell around the rectangle to see unknown neighbours.
+        outer_top, outer_left = max(top - 1, 0), max(left - 1, 0)
+        outer_rows = slice(outer_top, min(bottom + 1, n_rows))
+        outer_cols = slice(outer_left, min(right + 1, n_cols))
+
+        known = self.known[outer_rows, outer_cols]
+        frontier = (
+            get_neighbours_mask(~known) & known & self.free[outer_rows, outer_cols]
+        )
+        inner_rows = slice(top - outer_top, bottom - outer_top)
+        inner_cols = slice(left - outer_left, right - outer_left)
+        self.frontier[top:bottom, left:right] = frontier[inner_rows, inner_cols]
+
+
+class Explorer:
+    """
+    Frontier-based exploration of a field by a robot.
+
+    The robot goes to the closest frontier cell through known free
+    cells. The path is found with a multi-source BFS from all frontier
+    cells that runs in a window around the robot. The window is doubled
+    until a frontier is reached. Once the window covers the whole field,
+    the search is not limited by the window radius.
+    The path is followed while its target stays a frontier cell.
+
+    The robot is moved with its own movement methods, so the movement
+    history and the journal are kept as with manual commands.
+
+    Args:
+        robot: the robot to move. Should be in a field.
+        start_window_radius: the radius of the first BFS window.
+
+    Attributes:
+        robot: same that 'robot' in Args.
+        known_map: the part of the field the robot has seen.
+        path: names of movement methods left to reach the target.
+        target: the frontier cell at the end of the path.
+        start_window_radius: same that 'start_window_radius' in Args.
+        moves: the dictionary that maps coordinate deltas and
+               names of movement methods.
+    """
+
+    moves = {(-1, 0): "up", (1, 0): "down", (0, -1): "left", (0, 1): "right"}
+
+    def __init__(self, robot: Robot, start_window_radius: int = 8):
+        robot.check_field()
+        self.robot = robot
+        self.known_map = KnownMap(robot.field, robot.light_radius)
+        self.path = []
+        self.target = None
+        self.start_window_radius = start_window_radius
+
+    def plan(self) -> bool:
+        """Finds the path to the closest frontier cell.
+
+        Returns:
+            False if there is no reachable frontier cell, else True.
+        """
+        x, y = self.robot.x, self.robot.y
+        known_map = self.known_map
+        n_rows, n_cols = known_map.free.shape
+
+        radius = self.start_window_radius
+        while True:
+            top, left = max(x - radius, 0), max(y - radius, 0)
+            window = (slice(top, x + radius + 1), slice(left, y + radius + 1))
+            robot_cell = (x - top, y - left)
+
+            # Paths in the whole field can be longer than its sides,
+            # so the last search goes until the wavefront dies out.
+            covers_field = radius >= max(n_rows, n_cols)
+            distances = get_wavefront_distances(
+                known_map.known[window] & known_map.free[window],
+                known_map.frontier[window],
+                target=robot_cell,
+                max_distance=None if covers_field else radius,
+            )
+            if distances[robot_cell] != -1:
+                self.path, target = self.get_path(distances, robot_cell)
+                self.target = (target[0] + top, target[1] + left)
+                return True
+
+            if covers_field:
+                return False
+            radius *= 2
+
+    def get_path(
+        self, distances: np.ndarray, start: Tuple[int]
+    ) -> Tuple[List[str], Tuple[int]]:
+        """Goes down the BFS distances from 'start' to a source cell.
+
+        Args:
+            distances: BFS distances from source cells.
+            start: the cell to start from.
+
+        Returns:
+            reversed list with names of movement methods
+            and the source cell.
+        """
+        path = []
+        x, y = start
+        n_rows, n_cols = distances.shape
+        while distances[x, y]:
+            for (dx, dy), move in self.moves.items():
+                next_x, next_y = x + dx, y + dy
+                if (
+                    0 <= next_x < n_rows
+                    and 0 <= next_y < n_cols
+                    and distances[next_x, next_y] == distances[x, y] - 1
+                ):
+                    path.append(move)
+                    x, y = next_x, next_y
+                    break
+
+        return path[::-1], (x, y)
+
+    def explore(self, n_steps: int) -> np.ndarray:
+        """Moves the robot at most 'n_steps' times towards
+        the frontier. Stops earlier if everything reachable is seen.
+
+        Args:
+            n_steps: the maximal number of moves.
+
+        Returns:
+            array with the coverage after each move.
+        """
+        known_map = self.known_map
+        known_map.observe(self.robot.x, self.robot.y)
+        # The robot could be moved by other commands since the last run.
+        self.path = []
+
+        coverage = np.zeros(n_steps)
+        for step in range(n_steps):
+            if not (self.path and known_map.frontier[self.target]) and not self.plan():
+                return coverage[:step]
+
+            getattr(self.robot, self.path.pop())()
+            known_map.observe(self.robot.x, self.robot.y)
+            coverage[step] = known_map.coverage
+
+        return coverage
+
+
+def get_random_walk_coverage(
+    known_map: KnownMap, start: Tuple[int], n_steps: int, seed: int = None
+) -> np.ndarray:
+    """Simulates a robot that moves in random directions.
+
+    Args:
+        known_map: the part of the field seen before the walk.
+                   It is copied, not changed.
+        start: coordinates to start from.
+        n_steps: the number of moves.
+        seed: seed for the random generator.
+
+    Returns:
+        array with the coverage after each move.
+    """
+    known_map = known_map.copy()
+    known_map.observe(*start)
+
+    deltas = np.array(list(Explorer.moves))
+    steps = deltas[np.random.default_rng(seed).integers(0, 4, size=n_steps)]
+
+    coverage = np.zeros(n_steps)
+    x, y = start
+    for step, (dx, dy) in enumerate(steps.tolist()):
+        if known_map.free[x + dx, y + dy]:
+            x, y = x + dx, y + dy
+            known_map.observe(x, y)
+        coverage[step] = known_map.coverage
+
+    return coverage
+
+
+def explore_and_report(explorer: Explorer, n_steps: int = 100, n_reports: int = 10):
+    """Runs the exploration and prints the coverage compared
+    to a random walk with the same number of moves.
+
+    The movement reports of the robot are not printed.
+
+    Args:
+        explorer: the explorer to run.
+        n_steps: the maximal number of moves.
+        n_reports: the number of steps to print the coverage for.
+    """
+    if not n_steps:
+        print("The number of steps should be positive.")
+        return
+
+    start = (explorer.robot.x, explorer.robot.y)
+    known_map = explorer.known_map.copy()
+    known_map.observe(*start)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        coverage = explorer.explore(n_steps)
+
+    if not len(coverage):
+        print("Nothing to explore.")
+        return
+
+    baseline = get_random_walk_coverage(known_map, start, len(coverage))
+    report_steps = np.unique(np.linspace(1, len(coverage), n_reports, dtype=int))
+    for step in report_steps:
+        print(
+            f"Step {step}: coverage {coverage[step - 1]:.1%}, "
+            f"random walk {baseline[step - 1]:.1%}"
+        )
+    print(f"Current position: {(int(explorer.robot.x), int(explorer.robot.y))}")
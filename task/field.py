@@ -3,6 +3,62 @@ from typing import List, Tuple
 import numpy as np
 
 
+def get_neighbours_mask(mask: np.ndarray) -> np.ndarray:
+    """Finds cells that have at least one of 4 neighbours in 'mask'.
+
+    Args:
+        mask: 2-dimensional bool array.
+
+    Returns:
+        bool array of the same shape.
+    """
+    neighbours = np.zeros_like(mask)
+    neighbours[1:, :] |= mask[:-1, :]
+    neighbours[:-1, :] |= mask[1:, :]
+    neighbours[:, 1:] |= mask[:, :-1]
+    neighbours[:, :-1] |= mask[:, 1:]
+    return neighbours
+
+
+def get_wavefront_distances(
+    free: np.ndarray,
+    sources: np.ndarray,
+    target: Tuple[int] = None,
+    max_distance: int = None,
+) -> np.ndarray:
+    """Finds the shortest path length from the closest of 'sources'
+    to free cells (multi-source breadth-first search).
+
+    The search grows the whole wavefront at once with array shifts,
+    so each BFS layer costs a few vectorized operations.
+
+    Args:
+        free: bool array with cells that can be passed.
+        sources: bool array with cells to start the search from.
+        target: the cell to stop the search at when it is reached.
+        max_distance: the number of BFS layers to stop the search after.
+
+    Returns:
+        an array of 'free' shape with path lengths. Cells that are not
+        free or not reached are marked with '-1'.
+    """
+    distances = np.full(free.shape, -1)
+    wavefront = sources & free
+
+    distance = 0
+    while wavefront.any():
+        distances[wavefront] = distance
+        if target is not None and distances[target] != -1:
+            break
+        if distance == max_distance:
+            break
+
+        wavefront = get_neighbours_mask(wavefront) & free & (distances == -1)
+        distance += 1
+
+    return distances
+
+
 class Field:
     """
     A field that robot will explore.
@@ -64,24 +120,45 @@ class Field:
 
         Returns:
             Corresponding coordinates.
+
+        Raises:
+            ValueError: if there is no empty point in the field.
         """
         zero_rows, zero_columns = np.where(self.field == 0)
-        pairs_of_indices_where_zeros = zip(zero_rows, zero_columns)
+        if not len(zero_rows):
+            raise ValueError("There is no empty point in the field.")
 
         center = ((self.field.shape[0] - 1) / 2, (self.field.shape[1] - 1) / 2)
 
-        def distance_to_center(cell: Tuple[int]) -> float:
-            """Finds the distance from 'cell' to the field center.
+        # Squared distances keep the order, 'argmin' takes the first
+        # closest point in row-major order.
+        row_distances = zero_rows - center[0]
+        column_distances = zero_columns - center[1]
+        squared_distances = row_distances**2 + column_distances**2
+        closest = np.argmin(squared_distances)
 
-            Args:
-                cell: cell coordinates.
+        return int(zero_rows[closest]), int(zero_columns[closest])
 
-            Returns:
-                the distance from the center.
-            """
-            return np.sqrt((cell[0] - center[0]) ** 2 + (cell[1] - center[1]) ** 2)
+    def get_distances(
+        self, sources: List[Tuple[int]], target: Tuple[int] = None
+    ) -> np.ndarray:
+        """Finds the shortest path length from the closest of 'sources'
+        to every cell of the field (multi-source breadth-first search).
 
-        return min(pairs_of_indices_where_zeros, key=distance_to_center)
+        Args:
+            sources: coordinates of the cells to start the search from.
+            target: the cell to stop the search at when it is reached.
+                    Only cells closer than 'target' have path lengths
+                    then.
+
+        Returns:
+            an array of the field shape with path lengths.
+            Unreachable cells, walls and bariers are marked with '-1'.
+        """
+        sources_mask = np.zeros(self.field.shape, dtype=bool)
+        for cell in sources:
+            sources_mask[tuple(cell)] = True
+        return get_wavefront_distances(self.field == 0, sources_mask, target=target)
 
     def get_row_view(self, row: np.ndarray) -> List[str]:
         """Represents a numpy array row as ascii symbols.
@@ -0,0 +1,184 @@
+from typing import Tuple
+
+import numpy as np
+
+
+class Journal:
+    """
+    A compact journal of robot steps for undo and redo.
+
+    Each step is packed into one byte: the row delta, the column delta
+    (both in [-1, 1] range) and the turn (the difference of direction
+    codes modulo 4). Every 'anchor_interval' steps the absolute state
+    (row, column and direction code) is stored as an anchor, so any
+    state can be restored without replaying the whole journal.
+
+    Undo and redo sum the packed deltas of a slice of the journal
+    with numpy, so they never allocate anything per step.
+
+    Directions are stored as codes from 'direction_codes', numbered
+    clockwise, so the difference of two codes modulo 4 is a turn.
+
+    Args:
+        x, y: start coordinates of the robot.
+        direction: start direction code of the robot.
+        anchor_interval: the number of steps between anchors.
+
+    Attributes:
+        x, y: coordinates of the robot at 'cursor' step.
+        direction: direction code of the robot at 'cursor' step.
+        cursor: the number of steps that are not undone.
+        size: the number of recorded steps (including undone ones
+              that can be redone).
+        codes: array with packed steps. Only first 'size'
+               values are meaningful.
+        anchors: array with absolute states at each
+                 'anchor_interval' step.
+        anchor_interval: same that 'anchor_interval' in Args.
+        direction_codes: the dictionary that maps robot's direction
+                         and its code.
+    """
+
+    direction_codes = {"up": 0, "right": 1, "down": 2, "left": 3}
+
+    def __init__(self, x: int, y: int, direction: int, anchor_interval: int = 256):
+        self.x, self.y, self.direction = int(x), int(y), int(direction)
+        self.cursor = 0
+        self.size = 0
+
+        self.codes = np.zeros(anchor_interval, dtype=np.uint8)
+        self.anchors = np.zeros((1, 3), dtype=np.int64)
+        self.anchors[0] = (self.x, self.y, self.direction)
+        self.anchor_interval = anchor_interval
+
+    @staticmethod
+    def pack(dx: int, dy: int, turn: int) -> int:
+        """Packs a step into one byte.
+
+        Args:
+            dx: row delta in [-1, 1] range.
+            dy: column delta in [-1, 1] range.
+            turn: direction codes difference in [0, 3] range.
+
+        Returns:
+            packed step.
+
+        >>> Journal.pack(-1, 0, 0)
+        4
+        >>> Journal.unpack(np.array([Journal.pack(1, -1, 3)]))
+        (array([1]), array([-1]), array([3]))
+        """
+        return (dx + 1) | (dy + 1) << 2 | turn << 4
+
+    @staticmethod
+    def unpack(codes: np.ndarray) -> Tuple[np.ndarray]:
+        """Unpacks an array of packed steps.
+
+        Args:
+            codes: array with packed steps.
+
+        Returns:
+            arrays with row deltas, column deltas and turns.
+        """
+        codes = codes.astype(np.int64)
+        return (codes & 3) - 1, (codes >> 2 & 3) - 1, codes >> 4
+
+    def record(self, x: int, y: int, direction: int):
+        """Records a step that leads to the given state. Undone steps
+        are discarded, so they cannot be redone after that.
+
+        Args:
+            x, y: coordinates of the robot after the step.
+            direction: direction code of the robot after the step.
+        """
+        x, y, direction = int(x), int(y), int(direction)
+        if self.cursor == len(self.codes):
+            self.codes = np.concatenate((self.codes, np.zeros_like(self.codes)))
+
+        # Anchors after the cursor belong to undone steps.
+        self.anchors = self.anchors[: self.cursor // self.anchor_interval + 1]
+
+        turn = (direction - self.direction) % 4
+        self.codes[self.cursor] = self.pack(x - self.x, y - self.y, turn)
+        self.x, self.y, self.direction = x, y, direction
+        self.cursor += 1
+        self.size = self.cursor
+
+        if self.cursor % self.anchor_interval == 0:
+            self.anchors = np.concatenate(
+                (self.anchors, [[self.x, self.y, self.direction]])
+            )
+
+    def get_state(self, step: int) -> Tuple[int]:
+        """Restores the state of the robot after 'step' steps
+        starting from the closest anchor.
+
+        Args:
+            step: the number of steps from the start.
+                  Should be in [0, size] range.
+
+        Returns:
+            coordinates and direction code of the robot.
+        """
+        anchor = step // self.anchor_interval
+        anchor_step = anchor * self.anchor_interval
+        x, y, direction = (int(value) for value in self.anchors[anchor])
+        dx, dy, turn = self.unpack(self.codes[anchor_step:step])
+        return x + int(dx.sum()), y + int(dy.sum()), (direction + int(turn.sum())) % 4
+
+    def get_states(self, start: int, stop: int) -> np.ndarray:
+        """Restores the states of the robot after each step
+        from 'start' to 'stop' (both included).
+
+        Args:
+            start: the first step. Should be in [0, size] range.
+            stop: the last step. Should be in [start, size] range.
+
+        Returns:
+            (stop - start + 1, 3) array with coordinates
+            and direction codes.
+        """
+        states = np.zeros((stop - start + 1, 3), dtype=np.int64)
+        states[0] = self.get_state(start)
+        states[1:] = np.stack(self.unpack(self.codes[start:stop]), axis=1)
+        states = np.cumsum(states, axis=0)
+        states[:, 2] %= 4
+        return states
+
+    def undo(self, n: int = 1) -> int:
+        """Moves the cursor 'n' steps back.
+
+        Args:
+            n: the number of steps to undo.
+
+        Returns:
+            the number of undone steps (less than 'n' if
+            there are not enough steps).
+        """
+        n = min(n, self.cursor)
+        start, stop = self.cursor - n, self.cursor
+        dx, dy, turn = self.unpack(self.codes[start:stop])
+        self.x -= int(dx.sum())
+        self.y -= int(dy.sum())
+        self.direction = (self.direction - int(turn.sum())) % 4
+        self.cursor -= n
+        return n
+
+    def redo(self, n: int = 1) -> int:
+        """Moves the cursor 'n' steps forward.
+
+        Args:
+            n: the number of steps to redo.
+
+        Returns:
+            the number of redone steps (less than 'n' if
+            there are not enough undone steps).
+        """
+        n = min(n, self.size - self.cursor)
+        start, stop = self.cursor, self.cursor + n
+        dx, dy, turn = self.unpack(self.codes[start:stop])
+        self.x += int(dx.sum())
+        self.y += int(dy.sum())
+        self.direction = (self.direction + int(turn.sum())) % 4
+        self.cursor += n
+        return n
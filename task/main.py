@@ -1,20 +1,35 @@
 import argparse
+import sys
 
-from task.field import Field
-from task.robot import Robot
+from task.startup import (
+    COMMANDS,
+    COMMANDS_WITH_COUNT,
+    Timings,
+    get_commands,
+    set_up_robot_in_background,
+)
 
 if __name__ == "__main__":
+    timings = Timings()
+
     parser = argparse.ArgumentParser(description="A robot simulation.")
 
     parser.add_argument(
-        "--n_rows", type=int, help="The number of rows in a generated field."
+        "--n_rows",
+        type=int,
+        required=True,
+        help="The number of rows in a generated field.",
     )
     parser.add_argument(
-        "--n_cols", type=int, help="The number of columns in a generated field."
+        "--n_cols",
+        type=int,
+        required=True,
+        help="The number of columns in a generated field.",
     )
     parser.add_argument(
         "--p",
         type=float,
+        required=True,
         help="The probability that a cell will be a barrier. Shoul be in [0, 1] range.",
     )
     parser.add_argument("--radius", type=int, help="The radius the robot can see.")
@@ -23,34 +38,61 @@ if __name__ == "__main__":
         default="./robot_path.json",
         help="The path to the json file to store the movement information.",
     )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print the time elapsed since start after each startup phase.",
+    )
 
     args = parser.parse_args()
 
-    field = Field.generate_field(n_rows=args.n_rows, n_cols=args.n_cols, p=args.p)
-    robot = Robot(light_radius=args.radius, logfile_path=args.logfile)
+    # The field is generated in the background,
+    # so its arguments are checked before.
+    if args.n_rows < 1 or args.n_cols < 1:
+        parser.error("the field size should be positive")
+    if not 0 <= args.p <= 1:
+        parser.error("the probability should be in [0, 1] range")
+    timings.enabled = args.timings
+    timings.mark("argument parsing")
 
-    robot.put_in_field(field)
-
-    commands = {
-        "left": robot.left,
-        "right": robot.right,
-        "up": robot.up,
-        "down": robot.down,
-        "turn_left": robot.turn_left,
-        "turn_right": robot.turn_right,
-        "turn_back": robot.turn_back,
-        "look": robot.look_around,
-        "save": robot.save_path,
-    }
+    # The field is generated while the first command is typed.
+    robot_future = set_up_robot_in_background(
+        n_rows=args.n_rows,
+        n_cols=args.n_cols,
+        p=args.p,
+        radius=args.radius,
+        logfile=args.logfile,
+        timings=timings,
+    )
+    commands, commands_with_count = None, None
+    timings.mark("ready for commands")
 
     while True:
-        command = input()
+        command, *arguments = input().split() or [""]
 
         if command in ["exit", "stop", "quit"]:
             break
 
-        if command not in commands:
+        if not (
+            (command in COMMANDS and not arguments)
+            or (
+                command in COMMANDS_WITH_COUNT
+                and len(arguments) <= 1
+                and all(argument.isdigit() for argument in arguments)
+            )
+        ):
             print("wrong command")
             continue
 
-        commands[command]()
+        if commands is None:
+            try:
+                robot = robot_future.result()
+            except Exception as error:
+                sys.exit(f"Failed to set up the field: {error}")
+            commands, commands_with_count = get_commands(robot)
+            timings.mark("first command")
+
+        if command in commands:
+            commands[command]()
+        else:
+            commands_with_count[command](*map(int, arguments))
@@ -1,11 +1,14 @@
 import json
+import os
 from collections import defaultdict
 from functools import wraps
 from typing import Callable, Tuple
 
 import numpy as np
 
+from task.analytics import Trajectory, get_heatmap_view
 from task.field import Field
+from task.journal import Journal
 
 
 class FieldError(Exception):
@@ -29,6 +32,12 @@ class Robot:
                 specified by the 'light_radius' argument.
         - save: save all informations about robot movement to
                 json file.
+        - heatmap: print the whole field with the number of visits
+                   of each cell.
+        - analytics: print movement metrics and save them to .npy files
+                     next to the json file.
+        - undo: revert the last movements and turns.
+        - redo: repeat the reverted movements and turns.
 
     * To perform commands, the robot should be putted in a field
       via 'put_in_field' method.
@@ -52,6 +61,7 @@ class Robot:
               moves or turns.
         movement_history**: dictionary to store information about
                             movements and turns.
+        journal**: compact journal of steps for undo and redo.
         robot_code: the number to represent robot in a field matrix.
                     Should be different from numbers for walls and
                     bariers in a field. (Needed for 'look' method).
@@ -72,6 +82,7 @@ class Robot:
         self.direction = None
         self.step = None
         self.movement_history = None
+        self.journal = None
 
         self.robot_code = 3
         self.logfile_path = logfile_path
@@ -93,6 +104,7 @@ class Robot:
         self.direction = "up"
         self.step = 0
         self.movement_history = defaultdict(dict)
+        self.journal = Journal(self.x, self.y, Journal.direction_codes[self.direction])
 
     def check_field(self):
         """Checks if the robot is putted in a field.
@@ -157,6 +169,9 @@ class Robot:
                 func(*args, **kwargs)
                 step_log["current_position"] = (int(self.x), int(self.y))
                 step_log["current_direction"] = self.direction
+                self.journal.record(
+                    self.x, self.y, Journal.direction_codes[self.direction]
+                )
                 self.print_step_log(step_log)
                 self.step += 1
 
@@ -279,3 +294,71 @@ class Robot:
         """Saves movement history to 'self.logfile_path'."""
         with open(self.logfile_path, "w") as file:
             json.dump(self.movement_history, file, indent=4)
+
+    def print_heatmap(self):
+        """Prints the whole field with the number of times
+        the robot entered each cell."""
+        self.check_field()
+        trajectory = Trajectory.from_history(self.movement_history)
+        heatmap = trajectory.get_visit_heatmap(self.field.field.shape)
+        print(get_heatmap_view(self.field, heatmap))
+
+    def save_analytics(self):
+        """Prints movement metrics and saves them with the visit heatmap
+        to the '<logfile name>_analytics' directory as .npy files."""
+        self.check_field()
+        trajectory = Trajectory.from_history(self.movement_history)
+        directory = os.path.splitext(self.logfile_path)[0] + "_analytics"
+        trajectory.save_arrays(directory, self.field)
+
+        for name, value in trajectory.get_summary(self.field).items():
+            print(f"{name}: {value:g}")
+        print(f"Saved to {directory}")
+
+    def restore_journal_state(self):
+        """Sets the robot's position and direction
+        from the journal cursor and reports them."""
+        directions = list(Journal.direction_codes)
+        self.x, self.y = self.journal.x, self.journal.y
+        self.direction = directions[self.journal.direction]
+        print(f"Current position: {(self.x, self.y)}")
+        print(f"Current direction: {self.direction}")
+
+    def undo(self, n: int = 1):
+        """Reverts the last 'n' movements and turns. Reverted steps
+        are removed from the movement history.
+
+        Args:
+            n: the number of steps to revert.
+        """
+        self.check_field()
+        n = self.journal.undo(n)
+        for step in range(self.step - n, self.step):
+            del self.movement_history[step]
+        self.step -= n
+
+        print(f"Undone steps: {n}")
+        self.restore_journal_state()
+
+    def redo(self, n: int = 1):
+        """Repeats 'n' reverted movements and turns. Repeated steps
+        are added back to the movement history.
+
+        Args:
+            n: the number of steps to repeat.
+        """
+        self.check_field()
+        n = self.journal.redo(n)
+        directions = list(Journal.direction_codes)
+        states = self.journal.get_states(self.step, self.step + n)
+        for previous, current in zip(states[:-1], states[1:]):
+            self.movement_history[self.step] = {
+                "previous_position": (int(previous[0]), int(previous[1])),
+                "previous_direction": directions[previous[2]],
+                "current_position": (int(current[0]), int(current[1])),
+                "current_direction": directions[current[2]],
+            }
+            self.step += 1
+
+        print(f"Redone steps: {n}")
+        self.restore_journal_state()
@@ -0,0 +1,172 @@
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Dict, Tuple
+
+if TYPE_CHECKING:
+    from task.robot import Robot
+
+
+def get_explore_command(robot: "Robot") -> Callable:
+    """Makes 'explore' command for the robot. The explorer is created
+    on the first call, since only it needs the robot's light radius
+    (besides 'look'). Without the radius the command only reports it.
+
+    Args:
+        robot: the robot in a field.
+
+    Returns:
+        the command with an optional number of steps.
+    """
+    from task.explorer import Explorer, explore_and_report
+
+    explorer = None
+
+    def explore(*count: int):
+        nonlocal explorer
+        if robot.light_radius is None:
+            print("explore needs --radius")
+            return
+        if explorer is None:
+            explorer = Explorer(robot)
+        explore_and_report(explorer, *count)
+
+    return explore
+
+
+# Commands are checked before the robot is ready, so they map
+# names to functions that get the command from the robot.
+COMMANDS = {
+    "left": attrgetter("left"),
+    "right": attrgetter("right"),
+    "up": attrgetter("up"),
+    "down": attrgetter("down"),
+    "turn_left": attrgetter("turn_left"),
+    "turn_right": attrgetter("turn_right"),
+    "turn_back": attrgetter("turn_back"),
+    "look": attrgetter("look_around"),
+    "save": attrgetter("save_path"),
+    "heatmap": attrgetter("print_heatmap"),
+    "analytics": attrgetter("save_analytics"),
+}
+COMMANDS_WITH_COUNT = {
+    "undo": attrgetter("undo"),
+    "redo": attrgetter("redo"),
+    "explore": get_explore_command,
+}
+
+
+class Timings:
+    """
+    Startup instrumentation.
+
+    Stores the time elapsed since the object was created at the end
+    of each startup phase and prints it to stderr if enabled. Phases
+    of the background setup overlap with the main thread ones, so
+    the elapsed time is kept instead of phase durations.
+
+    Args:
+        enabled: whether to print timings.
+
+    Attributes:
+        enabled: same that 'enabled' in Args.
+        start: the time the object was created.
+        marks: the dictionary that maps phase names and
+               seconds since 'start'.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.marks = {}
+
+    def mark(self, phase: str):
+        """Stores (and prints if enabled) the time elapsed
+        since the start.
+
+        Args:
+            phase: the name of the finished phase.
+        """
+        self.marks[phase] = time.perf_counter() - self.start
+        if self.enabled:
+            print(
+                f"[timings] {phase} done at {self.marks[phase] * 1000:.1f} ms "
+                "since start",
+                file=sys.stderr,
+            )
+
+
+def set_up_robot(
+    n_rows: int, n_cols: int, p: float, radius: int, logfile: str, timings: Timings
+) -> "Robot":
+    """Generates a field and puts a robot in it.
+
+    NumPy and the modules that need it are imported here,
+    not on the application start.
+
+    Args:
+        n_rows: the number of rows in a generated field.
+        n_cols: the number of columns in a generated field.
+        p: the probability that a cell will be a barrier.
+        radius: the radius the robot can see.
+        logfile: the path to the json file to store
+                 the movement information.
+        timings: startup instrumentation.
+
+    Returns:
+        the robot in the field.
+    """
+    from task.field import Field
+    from task.robot import Robot
+
+    timings.mark("imports")
+
+    field = Field.generate_field(n_rows=n_rows, n_cols=n_cols, p=p)
+    timings.mark("field generation")
+
+    robot = Robot(light_radius=radius, logfile_path=logfile)
+    robot.put_in_field(field)
+    timings.mark("start point search")
+
+    return robot
+
+
+def set_up_robot_in_background(*args, **kwargs) -> Future:
+    """Runs 'set_up_robot' in a daemon thread, so the application
+    can read commands (and exit) without waiting for the field.
+
+    Args:
+        args, kwargs: arguments for 'set_up_robot'.
+
+    Returns:
+        the future with 'set_up_robot' result.
+    """
+    future = Future()
+
+    def set_up():
+        try:
+            future.set_result(set_up_robot(*args, **kwargs))
+        except Exception as error:
+            future.set_exception(error)
+
+    threading.Thread(target=set_up, daemon=True).start()
+    return future
+
+
+def get_commands(robot: "Robot") -> Tuple[Dict]:
+    """Binds 'COMMANDS' and 'COMMANDS_WITH_COUNT' to the robot.
+
+    Args:
+        robot: the robot in a field.
+
+    Returns:
+        the dictionary with commands without arguments and
+        the dictionary with commands with an optional count.
+    """
+    commands = {name: get(robot) for name, get in COMMANDS.items()}
+    commands_with_count = {
+        name: get(robot) for name, get in COMMANDS_WITH_COUNT.items()
+    }
+    return commands, commands_with_count
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from task.analytics import Trajectory, get_heatmap_view
+
+
+@pytest.fixture()
+def test_trajectory(test_robot, test_field, capsys):
+    test_robot.put_in_field(test_field)
+
+    test_robot.left()
+    test_robot.left()
+    test_robot.right()
+    test_robot.turn_left()
+    test_robot.right()
+    test_robot.left()
+    test_robot.up()
+    test_robot.turn_back()
+
+    capsys.readouterr()
+    return Trajectory.from_history(test_robot.movement_history)
+
+
+def test_from_history_method(test_trajectory):
+    """Testing 'from_history' method."""
+    assert len(test_trajectory) == 8
+    assert test_trajectory.previous_positions[0].tolist() == [2, 2]
+    assert test_trajectory.current_positions[-1].tolist() == [1, 2]
+    assert test_trajectory.current_directions.tolist() == [0, 0, 0, 3, 3, 3, 3, 1]
+
+
+def test_from_file_method(test_robot, test_field, tmp_path, capsys):
+    """Testing 'from_file' method."""
+    test_robot.logfile_path = tmp_path / "path.json"
+    test_robot.put_in_field(test_field)
+    test_robot.up()
+    test_robot.turn_right()
+    test_robot.save_path()
+    capsys.readouterr()
+
+    from_file = Trajectory.from_file(test_robot.logfile_path)
+    from_history = Trajectory.from_history(test_robot.movement_history)
+
+    assert np.array_equal(from_file.current_positions, from_history.current_positions)
+    assert np.array_equal(from_file.current_directions, from_history.current_directions)
+
+
+def test_get_visit_heatmap_method(test_trajectory, test_field):
+    """Testing 'get_visit_heatmap' and 'get_revisit_counts' methods."""
+    heatmap = test_trajectory.get_visit_heatmap(test_field.field.shape)
+
+    assert heatmap[2, 2] == 3
+    assert heatmap[2, 1] == 1
+    assert heatmap[2, 3] == 1
+    assert heatmap[1, 2] == 1
+    assert heatmap.sum() == 6
+
+    revisits = test_trajectory.get_revisit_counts(test_field.field.shape)
+    assert revisits.sum() == 2
+
+
+def test_scalar_metrics(test_trajectory, test_field):
+    """Testing blocked moves, turns, displacement and efficiency."""
+    assert test_trajectory.get_blocked_move_rate() == 1 / 6
+    assert test_trajectory.get_turn_counts() == {
+        "turn_right": 0,
+        "turn_back": 1,
+        "turn_left": 1,
+    }
+    assert test_trajectory.get_net_displacement().tolist() == [-1, 0]
+    assert test_trajectory.get_path_efficiency(test_field) == 1 / 5
+
+
+def test_empty_trajectory(test_field):
+    """Testing metrics of a trajectory without steps."""
+    trajectory = Trajectory.from_history({})
+
+    assert not trajectory.get_visit_heatmap(test_field.field.shape).any()
+    assert trajectory.get_blocked_move_rate() == 0
+    assert trajectory.get_net_displacement().tolist() == [0, 0]
+    assert trajectory.get_path_efficiency(test_field) == 1
+
+
+def test_get_summary_method(test_trajectory, test_field):
+    """Testing 'get_summary' method."""
+    assert test_trajectory.get_summary(test_field) == {
+        "steps": 8,
+        "revisits": 2,
+        "blocked_move_rate": 1 / 6,
+        "turn_right": 0,
+        "turn_back": 1,
+        "turn_left": 1,
+        "net_dx": -1,
+        "net_dy": 0,
+        "path_efficiency": 1 / 5,
+    }
+
+
+def test_save_arrays_method(test_trajectory, test_field, tmp_path):
+    """Testing 'save_arrays' method."""
+    test_trajectory.save_arrays(tmp_path, test_field)
+
+    heatmap = np.load(tmp_path / "visit_heatmap.npy")
+    revisits = np.load(tmp_path / "revisit_counts.npy")
+    positions = np.load(tmp_path / "current_positions.npy")
+    summary = np.load(tmp_path / "summary.npy")
+
+    shape = test_field.field.shape
+    assert np.array_equal(heatmap, test_trajectory.get_visit_heatmap(shape))
+    assert np.array_equal(revisits, test_trajectory.get_revisit_counts(shape))
+    assert np.array_equal(positions, test_trajectory.current_positions)
+    assert summary["revisits"][0] == 2
+    assert summary["path_efficiency"][0] == 1 / 5
+
+
+def test_get_heatmap_view_function(test_trajectory, test_field):
+    """Testing 'get_heatmap_view' function."""
+    heatmap = test_trajectory.get_visit_heatmap(test_field.field.shape)
+    view = get_heatmap_view(test_field, heatmap).split("\n")
+
+    assert view[1] == "x+1+x"
+    assert view[2] == "x131x"
+    assert view[3] == "x+.+x"
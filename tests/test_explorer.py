@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from task.explorer import (
+    Explorer,
+    KnownMap,
+    explore_and_report,
+    get_random_walk_coverage,
+)
+from task.field import Field
+
+
+@pytest.fixture()
+def corridor_field():
+    return Field(np.zeros((1, 9), dtype=int))
+
+
+@pytest.fixture()
+def maze_field():
+    """Serpentine maze: barrier rows with a gap at alternating ends."""
+    matrix = np.zeros((21, 21), dtype=int)
+    matrix[1::2] = 1
+    matrix[1::4, -1] = 0
+    matrix[3::4, 0] = 0
+    return Field(matrix)
+
+
+def test_observe_method(test_field):
+    """Testing that 'observe' updates known cells and frontier."""
+    known_map = KnownMap(test_field, light_radius=1)
+    known_map.observe(2, 2)
+
+    plus = np.zeros((5, 5), dtype=bool)
+    plus[1:4, 2] = True
+    plus[2, 1:4] = True
+
+    assert np.array_equal(known_map.known, plus)
+    assert known_map.frontier.sum() == 4
+    assert not known_map.frontier[2, 2]
+    assert known_map.coverage == 1
+
+    known_map.observe(2, 1)
+    assert not known_map.frontier[2, 1]
+
+
+def test_explore_method(test_robot, corridor_field, capsys):
+    """Testing that the explorer sees the whole corridor and stops."""
+    test_robot.put_in_field(corridor_field)
+    explorer = Explorer(test_robot)
+
+    coverage = explorer.explore(100)
+    capsys.readouterr()
+
+    assert coverage[-1] == 1
+    assert np.all(np.diff(coverage) >= 0)
+    assert len(coverage) == test_robot.step == 12
+    assert not explorer.known_map.frontier.any()
+
+
+def test_explore_method_in_maze(test_robot, maze_field, capsys):
+    """Testing that frontiers farther than field sides are reached."""
+    test_robot.put_in_field(maze_field)
+    explorer = Explorer(test_robot)
+
+    coverage = explorer.explore(100000)
+    capsys.readouterr()
+
+    assert coverage[-1] == 1
+    assert not explorer.known_map.frontier.any()
+
+
+def test_get_random_walk_coverage_function(test_robot, corridor_field):
+    """Testing the random walk baseline."""
+    test_robot.put_in_field(corridor_field)
+    known_map = KnownMap(corridor_field, light_radius=1)
+
+    coverage = get_random_walk_coverage(known_map, (1, 5), 50, seed=1)
+
+    assert len(coverage) == 50
+    assert np.all(np.diff(coverage) >= 0)
+    assert np.array_equal(
+        coverage, get_random_walk_coverage(known_map, (1, 5), 50, seed=1)
+    )
+    assert not known_map.known.any()
+
+
+def test_explore_and_report_function(test_robot, test_field, capsys):
+    """Testing the exploration report."""
+    test_robot.put_in_field(test_field)
+    explorer = Explorer(test_robot)
+
+    explore_and_report(explorer, 10, n_reports=2)
+    out, _ = capsys.readouterr()
+    out = out.split("\n")
+
+    assert out[0].startswith("Step 1: coverage 100.0%, random walk")
+    assert out[1].startswith("Step 7: coverage 100.0%, random walk")
+    assert out[2] == "Current position: (2, 3)"
+
+    explore_and_report(explorer, 0)
+    out, _ = capsys.readouterr()
+    assert out == "The number of steps should be positive.\n"
+
+    explore_and_report(explorer, 10)
+    out, _ = capsys.readouterr()
+    assert out == "Nothing to explore.\n"
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from task.field import Field
 
@@ -39,6 +40,10 @@ def test_get_closest_to_center_available_point_method(test_field):
     closest_point = even_test_field.get_closest_to_center_available_point()
     assert closest_point == (2, 2)
 
+    barrier_field = Field(np.ones((2, 2), dtype=int))
+    with pytest.raises(ValueError, match="There is no empty point in the field."):
+        barrier_field.get_closest_to_center_available_point()
+
 
 def test_get_row_view_method(test_field):
     """Testing 'get_row_view' method."""
@@ -68,3 +73,29 @@ def test_get_matrix_view_method(test_field):
         [wall, barier, space, barier, wall],
         [wall, wall, wall, wall, wall],
     ]
+
+
+def test_get_distances_method(test_field):
+    """Testing 'get_distances' method."""
+    distances = test_field.get_distances([(2, 2)])
+
+    assert np.array_equal(
+        distances,
+        np.array(
+            [
+                [-1, -1, -1, -1, -1],
+                [-1, -1, 1, -1, -1],
+                [-1, 1, 0, 1, -1],
+                [-1, -1, 1, -1, -1],
+                [-1, -1, -1, -1, -1],
+            ]
+        ),
+    )
+
+    distances = test_field.get_distances([(1, 2), (3, 2)])
+    assert distances[2, 1] == 2
+    assert distances[2, 2] == 1
+
+    distances = test_field.get_distances([(1, 2)], target=(2, 2))
+    assert distances[2, 2] == 1
+    assert distances[3, 2] == -1
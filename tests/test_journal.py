@@ -0,0 +1,59 @@
+import numpy as np
+
+from task.journal import Journal
+
+
+def test_record_method():
+    """Testing that steps are packed and anchors are stored."""
+    journal = Journal(5, 5, 0, anchor_interval=2)
+
+    journal.record(4, 5, 0)
+    journal.record(4, 5, 3)
+    journal.record(4, 6, 3)
+
+    assert journal.size == 3
+    assert journal.codes[:3].tolist() == [
+        Journal.pack(-1, 0, 0),
+        Journal.pack(0, 0, 3),
+        Journal.pack(0, 1, 0),
+    ]
+    assert journal.anchors.tolist() == [[5, 5, 0], [4, 5, 3]]
+
+
+def test_get_state_method():
+    """Testing that states restored from anchors match recorded ones."""
+    journal = Journal(0, 0, 0, anchor_interval=3)
+    rng = np.random.default_rng(0)
+    states = [(0, 0, 0)]
+    for dx, dy, turn in rng.integers(-1, 2, size=(20, 3)):
+        x, y, direction = states[-1]
+        states.append((x + dx, y + dy, (direction + turn) % 4))
+        journal.record(*states[-1])
+
+    for step, state in enumerate(states):
+        assert journal.get_state(step) == state
+
+    assert journal.get_states(4, 9).tolist() == [list(s) for s in states[4:10]]
+
+
+def test_undo_redo_methods():
+    """Testing undo, redo and discarding undone steps."""
+    journal = Journal(0, 0, 0, anchor_interval=2)
+    for step in range(1, 6):
+        journal.record(step, 0, step % 4)
+
+    assert journal.undo(3) == 3
+    assert (journal.x, journal.y, journal.direction) == (2, 0, 2)
+    assert journal.redo(1) == 1
+    assert (journal.x, journal.y, journal.direction) == (3, 0, 3)
+    assert journal.undo(10) == 3
+    assert (journal.x, journal.y, journal.direction) == (0, 0, 0)
+    assert journal.redo(10) == 5
+    assert (journal.x, journal.y, journal.direction) == (5, 0, 1)
+
+    journal.undo(2)
+    journal.record(3, 1, 3)
+    assert journal.size == 4
+    assert journal.redo() == 0
+    assert journal.anchors.tolist() == [[0, 0, 0], [2, 0, 2], [3, 1, 3]]
+    assert journal.get_state(3) == (3, 0, 3)
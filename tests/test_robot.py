@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from task.robot import FieldError
@@ -186,3 +187,59 @@ def test_look_around_method(test_robot, test_field, capsys):
     assert out[0] == " " + in_color(barier) + " "
     assert out[1] == in_color(space) + in_color(r_view) + in_color(wall)
     assert out[2] == " " + in_color(barier) + " "
+
+
+def test_undo_redo_commands(test_robot, test_field, capsys):
+    """Testing undo and redo commands."""
+    test_robot.put_in_field(test_field)
+    test_robot.left()
+    test_robot.turn_right()
+    test_robot.right()
+    history = dict(test_robot.movement_history)
+
+    test_robot.undo(2)
+    assert (test_robot.x, test_robot.y) == (2, 1)
+    assert test_robot.direction == "up"
+    assert test_robot.step == 1
+    assert list(test_robot.movement_history) == [0]
+
+    test_robot.undo(5)
+    assert (test_robot.x, test_robot.y) == (2, 2)
+    assert test_robot.step == 0
+
+    test_robot.redo(10)
+    assert (test_robot.x, test_robot.y) == (2, 2)
+    assert test_robot.direction == "right"
+    assert test_robot.step == 3
+    assert test_robot.movement_history == history
+
+    test_robot.undo()
+    test_robot.up()
+    test_robot.redo()
+    assert (test_robot.x, test_robot.y) == (2, 1)
+    assert test_robot.step == 3
+
+    out, _ = capsys.readouterr()
+    out = out.split("\n")
+    assert out[-4] == "Redone steps: 0"
+    assert out[-3] == "Current position: (2, 1)"
+    assert out[-2] == "Current direction: right"
+
+
+def test_save_analytics_method(test_robot, test_field, tmp_path, capsys):
+    """Testing 'save_analytics' method."""
+    test_robot.logfile_path = str(tmp_path / "path.json")
+    test_robot.put_in_field(test_field)
+    test_robot.left()
+    test_robot.right()
+    capsys.readouterr()
+
+    test_robot.save_analytics()
+    out, _ = capsys.readouterr()
+    out = out.split("\n")
+
+    directory = tmp_path / "path_analytics"
+    assert out[0] == "steps: 2"
+    assert out[1] == "revisits: 1"
+    assert out[-2] == f"Saved to {directory}"
+    assert np.load(directory / "visit_heatmap.npy")[2, 2] == 2
@@ -0,0 +1,122 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from task.startup import (
+    COMMANDS,
+    COMMANDS_WITH_COUNT,
+    Timings,
+    get_commands,
+    set_up_robot,
+    set_up_robot_in_background,
+)
+
+
+def test_timings_class(capsys):
+    """Testing that timings are stored and printed only if enabled."""
+    timings = Timings()
+    timings.mark("first")
+    timings.enabled = True
+    timings.mark("second")
+
+    assert 0 <= timings.marks["first"] <= timings.marks["second"]
+
+    _, err = capsys.readouterr()
+    assert err.startswith("[timings] second done at ")
+    assert err.endswith(" ms since start\n")
+    assert "first" not in err
+
+
+def test_set_up_robot_in_background_function():
+    """Testing that the robot is put in a generated field."""
+    timings = Timings()
+    future = set_up_robot_in_background(
+        n_rows=5, n_cols=7, p=0.2, radius=2, logfile="path.json", timings=timings
+    )
+    robot = future.result()
+
+    assert robot.field.field.shape == (7, 9)
+    assert robot.field.field[robot.x, robot.y] == 0
+    assert list(timings.marks) == [
+        "imports",
+        "field generation",
+        "start point search",
+    ]
+
+
+def test_set_up_robot_in_background_error():
+    """Testing that setup errors are raised with the result."""
+    future = set_up_robot_in_background(
+        n_rows=5, n_cols=5, p=2, radius=2, logfile="path.json", timings=Timings()
+    )
+
+    with pytest.raises(ValueError, match="probabilities"):
+        future.result()
+
+
+def test_get_commands_function():
+    """Testing that commands are bound to the robot."""
+    robot = set_up_robot(
+        n_rows=3, n_cols=3, p=0, radius=1, logfile="path.json", timings=Timings()
+    )
+    commands, commands_with_count = get_commands(robot)
+
+    assert commands.keys() == COMMANDS.keys()
+    assert commands_with_count.keys() == COMMANDS_WITH_COUNT.keys()
+    assert commands["look"] == robot.look_around
+
+
+def test_main_module_does_not_import_numpy():
+    """Testing that NumPy is not imported before the setup."""
+    check = "import sys, task.main; print('numpy' in sys.modules)"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", check],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(__file__))),
+    )
+
+    assert result.stdout == "False\n"
+
+
+def test_get_commands_without_radius(capsys):
+    """Testing that only 'look' and 'explore' need the radius."""
+    robot = set_up_robot(
+        n_rows=3, n_cols=3, p=0, radius=None, logfile="path.json", timings=Timings()
+    )
+    commands, commands_with_count = get_commands(robot)
+
+    commands["left"]()
+    commands_with_count["undo"]()
+    out, _ = capsys.readouterr()
+    assert "Current position: (2, 2)" in out
+
+    commands_with_count["explore"]()
+    out, _ = capsys.readouterr()
+    assert out == "explore needs --radius\n"
+
+
+@pytest.mark.parametrize(
+    ("arguments", "message"),
+    [
+        (["--n_cols=5", "--p=0.2"], "the following arguments are required"),
+        (["--n_rows=0", "--n_cols=5", "--p=0.2"], "size should be positive"),
+        (["--n_rows=5", "--n_cols=5", "--p=3"], "should be in [0, 1] range"),
+    ],
+)
+def test_main_module_validates_arguments(arguments, message):
+    """Testing that wrong arguments fail before any command."""
+    main_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "task")
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, os.path.join(main_path, "main.py"), *arguments],
+        input="exit\n",
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, PYTHONPATH=os.path.dirname(main_path)),
+    )
+
+    assert result.returncode == 2
+    assert message in result.stderr